@@ -1,48 +1,155 @@
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, validator
-from typing import List
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, PrivateAttr, validator
+from typing import List, Set, Tuple
+import asyncio
+from contextlib import asynccontextmanager
 import feedparser
+import hashlib
 import httpx
+import io
+import orjson
 import re
+from lxml import etree
 from datetime import datetime
 import logging
 import os
 from dotenv import load_dotenv
-from collections import defaultdict
 import time
+import redis.asyncio as aioredis
 
 load_dotenv()
 
+# Precompiled patterns used on the request hot path
+_TOPIC_RE = re.compile(r'^[a-zA-Z0-9.\-_]+$')
+_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9.\-_]')
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Podcast Studio API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled HTTP client for the life of the process: keep-alive (and
+    # HTTP/2 multiplexing) avoids a fresh TCP+TLS handshake to
+    # export.arxiv.org on every fetch
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        headers={
+            # Atom XML compresses 3-4x; ask for it explicitly rather than
+            # relying on client defaults. The User-Agent identifies us in
+            # arXiv's logs, per their API guidelines.
+            "Accept-Encoding": "gzip, deflate",
+            "User-Agent": "virtual-podcast-studio/1.0 (https://github.com/sergiopesch/virtualpodcaststudio)",
+        },
+    )
+    # Without eviction the in-process rate limit store keeps an entry for
+    # every IP that ever connected; sweep idle ones in the background
+    sweeper = asyncio.create_task(_sweep_rate_limit_store())
+    yield
+    sweeper.cancel()
+    await app.state.http.aclose()
+
+app = FastAPI(
+    title="Podcast Studio API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
-# Simple rate limiting
-rate_limit_store = defaultdict(list)
+# Rate limiting. The in-process store holds one (tokens, last_refill) pair
+# per client IP - constant memory and O(1) work per check.
+rate_limit_store = {}
 RATE_LIMIT_REQUESTS = 100  # requests per minute
 RATE_LIMIT_WINDOW = 60  # seconds
+RATE_LIMIT_REFILL_RATE = RATE_LIMIT_REQUESTS / RATE_LIMIT_WINDOW  # tokens per second
+
+# When REDIS_URL is set, rate limiting runs against a shared Redis rolling
+# window so counts stay correct across multiple workers. The whole
+# remove-count-add sequence runs as one Lua script for atomicity.
+_RATE_LIMIT_LUA = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', tonumber(ARGV[1]) - tonumber(ARGV[2]))
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[3]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[1], ARGV[4])
+redis.call('PEXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+REDIS_URL = os.getenv("REDIS_URL")
+redis_client = aioredis.from_url(REDIS_URL) if REDIS_URL else None
+_rate_limit_script = redis_client.register_script(_RATE_LIMIT_LUA) if redis_client else None
+
+# In-process cache of per-topic arXiv results. arXiv only updates once a day,
+# so serving repeats from memory avoids a ~500ms round-trip per topic.
+arxiv_cache = {}
+ARXIV_CACHE_TTL = 86400  # seconds
+ARXIV_CACHE_MAXSIZE = 512  # entries per cache
+ARXIV_FETCH_TIMEOUT = 10.0  # seconds per arXiv request
 
-def check_rate_limit(client_ip: str) -> bool:
-    """Simple rate limiting check"""
+# Serialized /api/papers response bodies keyed by the requested topic set, so
+# cache hits skip pydantic serialization entirely and return stored bytes
+papers_response_cache = {}
+
+def _cache_put(cache: dict, key, value) -> None:
+    """Insert into a cache dict, evicting the oldest entry once full"""
+    if key not in cache and len(cache) >= ARXIV_CACHE_MAXSIZE:
+        # dicts iterate in insertion order, so the first key is the oldest
+        cache.pop(next(iter(cache)))
+    cache[key] = value
+
+def _check_rate_limit_local(client_ip: str) -> bool:
+    """In-process token-bucket check (single-worker deployments)"""
     now = time.time()
-    
-    # Clean old requests
-    rate_limit_store[client_ip] = [
-        timestamp for timestamp in rate_limit_store[client_ip]
-        if now - timestamp < RATE_LIMIT_WINDOW
-    ]
-    
-    # Check if under limit
-    if len(rate_limit_store[client_ip]) >= RATE_LIMIT_REQUESTS:
+    tokens, last_refill = rate_limit_store.get(client_ip, (float(RATE_LIMIT_REQUESTS), now))
+
+    # Refill continuously based on elapsed time, capped at the bucket size
+    tokens = min(float(RATE_LIMIT_REQUESTS), tokens + (now - last_refill) * RATE_LIMIT_REFILL_RATE)
+
+    if tokens < 1.0:
+        rate_limit_store[client_ip] = (tokens, now)
         return False
-    
-    # Add current request
-    rate_limit_store[client_ip].append(now)
+
+    rate_limit_store[client_ip] = (tokens - 1.0, now)
     return True
 
+async def _sweep_rate_limit_store() -> None:
+    """Periodically drop IPs whose buckets have long since refilled"""
+    while True:
+        await asyncio.sleep(RATE_LIMIT_WINDOW)
+        cutoff = time.time() - RATE_LIMIT_WINDOW * 10
+        stale_ips = [
+            ip for ip, (_, last_refill) in rate_limit_store.items()
+            if last_refill < cutoff
+        ]
+        for ip in stale_ips:
+            del rate_limit_store[ip]
+        if stale_ips:
+            logger.info(f"Evicted {len(stale_ips)} idle IPs from the rate limit store")
+
+async def check_rate_limit(client_ip: str) -> bool:
+    """Rate limiting check; uses Redis when configured, in-process otherwise"""
+    if _rate_limit_script is not None:
+        now_ms = time.time_ns() // 1_000_000
+        try:
+            allowed = await _rate_limit_script(
+                keys=[f"ratelimit:{client_ip}"],
+                args=[now_ms, RATE_LIMIT_WINDOW * 1000, RATE_LIMIT_REQUESTS, time.time_ns()],
+            )
+            return bool(allowed)
+        except aioredis.RedisError as e:
+            # Fall back to the in-process limiter rather than failing requests
+            logger.error(f"Redis rate limit check failed: {e}")
+    return _check_rate_limit_local(client_ip)
+
+# Compress JSON responses above 1KB; paper abstracts shrink 5-10x on the wire
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Add CORS middleware
 allowed_origins = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000,http://localhost:3001").split(",")
 app.add_middleware(
@@ -65,17 +172,21 @@ class PaperRequest(BaseModel):
         
         valid_topics = []
         for topic in v:
-            if not isinstance(topic, str):
-                raise ValueError('All topics must be strings')
+            # pydantic has already enforced List[str] by the time the
+            # validator runs, so no isinstance check is needed here
             if len(topic) > 50:
                 raise ValueError('Topic length cannot exceed 50 characters')
-            if not re.match(r'^[a-zA-Z0-9.\-_]+$', topic):
+            if not _TOPIC_RE.match(topic):
                 raise ValueError('Topic contains invalid characters')
             valid_topics.append(topic)
         
         return valid_topics
 
 class Paper(BaseModel):
+    # Frozen (and therefore hashable): instances are shared between the
+    # per-topic cache and live responses, so nothing may mutate them
+    model_config = ConfigDict(frozen=True)
+
     id: str
     title: str
     authors: str
@@ -83,6 +194,10 @@ class Paper(BaseModel):
     published: str
     arxiv_url: str
 
+    # Parsed form of `published`, set at parse time and used for sorting so
+    # ordering compares datetimes instead of raw strings
+    _published_dt: datetime = PrivateAttr(default=datetime.min)
+
 class PaperResponse(BaseModel):
     papers: List[Paper]
 
@@ -95,7 +210,7 @@ def sanitize_input(topic: str) -> str:
     topic = topic.strip()[:50]
     
     # Only allow alphanumeric, dots, hyphens, and underscores
-    sanitized = re.sub(r'[^a-zA-Z0-9.\-_]', '', topic)
+    sanitized = _SANITIZE_RE.sub('', topic)
     
     # Additional validation - must start with alphanumeric
     if not sanitized or not sanitized[0].isalnum():
@@ -105,112 +220,352 @@ def sanitize_input(topic: str) -> str:
 
 def format_authors(authors: str) -> str:
     """Format authors string for display"""
-    # Split by comma and take first 3 authors, add "et al." if more
-    author_list = [author.strip() for author in authors.split(',')]
-    if len(author_list) > 3:
-        return f"{', '.join(author_list[:3])}, et al."
-    return ', '.join(author_list)
-
-async def fetch_arxiv_papers(topics: List[str], max_results: int = 10) -> List[Paper]:
-    """Fetch papers from arXiv API for given topics"""
+    # Single-author papers are common; skip the split entirely
+    if ',' not in authors:
+        return authors.strip()
+
+    # Take first 3 authors, add "et al." if more. Capping the split at four
+    # tokens avoids building a full list just to throw the tail away.
+    author_list = authors.split(',', 3)
+    displayed = ', '.join(author.strip() for author in author_list[:3])
+    if len(author_list) > 3 and author_list[3].strip():
+        return f"{displayed}, et al."
+    return displayed
+
+# arXiv API endpoint; query strings are built by httpx from params dicts so
+# values are URL-escaped properly
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+
+# Atom namespace used by the arXiv API responses
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+
+def parse_published(published: str) -> datetime:
+    """Parse arXiv's fixed-format UTC timestamp (e.g. 2024-01-02T10:00:00Z)"""
+    try:
+        return datetime.strptime(published, "%Y-%m-%dT%H:%M:%SZ")
+    except ValueError:
+        logger.warning(f"Unexpected published timestamp from arXiv: {published}")
+        return datetime.min
+
+def parse_arxiv_feed(feed_content: bytes, max_results: int) -> List[Tuple[Paper, Set[str]]]:
+    """Parse an arXiv Atom feed into (Paper, category terms) pairs"""
+    try:
+        return _parse_arxiv_feed_lxml(feed_content, max_results)
+    except etree.XMLSyntaxError as e:
+        # lxml rejects malformed XML outright; feedparser is slower but lenient
+        logger.warning(f"lxml failed to parse arXiv feed, falling back to feedparser: {e}")
+        return _parse_arxiv_feed_feedparser(feed_content, max_results)
+
+def _parse_arxiv_feed_lxml(feed_content: bytes, max_results: int) -> List[Tuple[Paper, Set[str]]]:
+    """Stream-parse the Atom feed with lxml, extracting only the fields we use"""
     papers = []
-    
+    context = etree.iterparse(
+        io.BytesIO(feed_content), events=("end",), tag=f"{ATOM_NS}entry"
+    )
+
+    for _, entry in context:
+        try:
+            # Extract paper information
+            paper_id = entry.findtext(f"{ATOM_NS}id", "").split('/abs/')[-1]
+            title = (entry.findtext(f"{ATOM_NS}title") or "").strip()
+
+            # Format authors
+            authors = ", ".join(
+                name.text.strip()
+                for name in entry.findall(f"{ATOM_NS}author/{ATOM_NS}name")
+                if name.text
+            )
+            formatted_authors = format_authors(authors)
+
+            # Clean abstract
+            abstract = " ".join((entry.findtext(f"{ATOM_NS}summary") or "").split())
+
+            # Parse published date
+            published_date = entry.findtext(f"{ATOM_NS}published", "")
+
+            # Create arXiv URL
+            arxiv_url = f"https://arxiv.org/abs/{paper_id}"
+
+            # Category terms let callers group a multi-category feed by topic
+            categories = {
+                category.get("term")
+                for category in entry.findall(f"{ATOM_NS}category")
+                if category.get("term")
+            }
+
+            # Fields come from our own sanitized parsing, so skip the full
+            # pydantic validation pass per entry
+            paper = Paper.model_construct(
+                id=paper_id,
+                title=title,
+                authors=formatted_authors,
+                abstract=abstract,
+                published=published_date,
+                arxiv_url=arxiv_url
+            )
+            paper._published_dt = parse_published(published_date)
+
+            papers.append((paper, categories))
+
+        except Exception as e:
+            logger.error(f"Error processing paper entry: {e}")
+        finally:
+            # Free each processed element so memory stays flat on large feeds
+            entry.clear()
+
+        # arXiv already sorts by submittedDate desc, so the first max_results
+        # entries are the right ones - stop parsing the rest of the feed
+        if len(papers) >= max_results:
+            break
+
+    return papers
+
+def _parse_arxiv_feed_feedparser(feed_content: bytes, max_results: int) -> List[Tuple[Paper, Set[str]]]:
+    """Fallback parser for feeds lxml cannot handle"""
+    papers = []
+    feed = feedparser.parse(feed_content)
+
+    for entry in feed.entries[:max_results]:
+        try:
+            # Extract paper information
+            paper_id = entry.id.split('/abs/')[-1]
+            title = entry.title.strip()
+
+            # Format authors
+            authors = ", ".join([author.name for author in entry.authors])
+            formatted_authors = format_authors(authors)
+
+            # Clean abstract
+            abstract = " ".join(entry.summary.split())
+
+            # Parse published date
+            published_date = entry.published
+
+            # Create arXiv URL
+            arxiv_url = f"https://arxiv.org/abs/{paper_id}"
+
+            categories = {tag.term for tag in entry.get("tags", []) if tag.get("term")}
+
+            # Fields come from our own sanitized parsing, so skip the full
+            # pydantic validation pass per entry
+            paper = Paper.model_construct(
+                id=paper_id,
+                title=title,
+                authors=formatted_authors,
+                abstract=abstract,
+                published=published_date,
+                arxiv_url=arxiv_url
+            )
+            paper._published_dt = parse_published(published_date)
+
+            papers.append((paper, categories))
+
+        except Exception as e:
+            logger.error(f"Error processing paper entry: {e}")
+            continue
+
+    return papers
+
+async def fetch_arxiv_papers(
+    topics: List[str], client: httpx.AsyncClient, max_results: int = 10
+) -> Tuple[List[Paper], List[str]]:
+    """Fetch papers from arXiv API for given topics.
+
+    Returns the collected papers plus the list of topics that could not be
+    fetched, so callers can surface partial results instead of failing the
+    whole request over one flaky topic.
+    """
+    papers = []
+    failed_topics = []
+
     if not topics:
         logger.warning("No topics provided for arXiv query")
-        return papers
-    
-    try:
-        for topic in topics:
-            sanitized_topic = sanitize_input(topic)
-            if not sanitized_topic:
-                logger.warning(f"Skipping invalid topic: {topic}")
-                continue
-                
-            # Build arXiv API query
-            query = f"cat:{sanitized_topic}"
-            url = f"https://export.arxiv.org/api/query?search_query={query}&start=0&max_results={max_results}&sortBy=submittedDate&sortOrder=descending"
-            
-            logger.info(f"Fetching papers from arXiv for topic: {sanitized_topic}")
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, timeout=30.0)
+        return papers, failed_topics
+
+    sanitized_topics = []
+    for topic in topics:
+        sanitized_topic = sanitize_input(topic)
+        if not sanitized_topic:
+            logger.warning(f"Skipping invalid topic: {topic}")
+            continue
+        sanitized_topics.append(sanitized_topic)
+
+    if not sanitized_topics:
+        return papers, failed_topics
+
+    # Deduplicate across topics as papers are collected (a paper can appear
+    # in several categories)
+    seen_ids = set()
+
+    # Serve topics queried within the last day from the in-process cache
+    now = time.time()
+    uncached_topics = []
+    for sanitized_topic in sanitized_topics:
+        cached = arxiv_cache.get((sanitized_topic, max_results))
+        if cached and now - cached[0] < ARXIV_CACHE_TTL:
+            for paper in cached[1]:
+                if paper.id not in seen_ids:
+                    seen_ids.add(paper.id)
+                    papers.append(paper)
+        else:
+            uncached_topics.append(sanitized_topic)
+
+    if not uncached_topics:
+        logger.info(f"Serving all {len(sanitized_topics)} topics from cache")
+    else:
+        try:
+            entries = None
+            try:
+                # Batch every uncached topic into one OR query so arXiv merges
+                # and sorts the categories server-side in a single round trip
+                query = " OR ".join(f"cat:{topic}" for topic in uncached_topics)
+                fetch_max = min(max_results * len(uncached_topics), 200)
+                params = {
+                    "search_query": query,
+                    "start": 0,
+                    "max_results": fetch_max,
+                    "sortBy": "submittedDate",
+                    "sortOrder": "descending",
+                }
+
+                logger.info(f"Fetching papers from arXiv for topics: {', '.join(uncached_topics)}")
+
+                response = await asyncio.wait_for(
+                    client.get(ARXIV_API_URL, params=params), ARXIV_FETCH_TIMEOUT
+                )
                 response.raise_for_status()
-                
-                # Parse the Atom feed
-                feed = feedparser.parse(response.text)
-                
-                for entry in feed.entries[:max_results]:
-                    try:
-                        # Extract paper information
-                        paper_id = entry.id.split('/abs/')[-1]
-                        title = entry.title.strip()
-                        
-                        # Format authors
-                        authors = ", ".join([author.name for author in entry.authors])
-                        formatted_authors = format_authors(authors)
-                        
-                        # Clean abstract
-                        abstract = re.sub(r'\s+', ' ', entry.summary.strip())
-                        
-                        # Parse published date
-                        published_date = entry.published
-                        
-                        # Create arXiv URL
-                        arxiv_url = f"https://arxiv.org/abs/{paper_id}"
-                        
-                        paper = Paper(
-                            id=paper_id,
-                            title=title,
-                            authors=formatted_authors,
-                            abstract=abstract,
-                            published=published_date,
-                            arxiv_url=arxiv_url
+                # Parsing is a synchronous CPU burst; run it on a worker
+                # thread so the event loop keeps serving other requests
+                entries = await asyncio.to_thread(parse_arxiv_feed, response.content, fetch_max)
+            except (httpx.HTTPError, asyncio.TimeoutError) as e:
+                logger.error(f"Batched arXiv query failed, retrying topics individually: {e}")
+
+            fetched_at = time.time()
+            if entries is not None:
+                # Split the merged Atom feed back out by category so each
+                # topic can be cached (and capped) on its own
+                for sanitized_topic in uncached_topics:
+                    topic_papers = [
+                        paper for paper, categories in entries
+                        if sanitized_topic in categories
+                    ][:max_results]
+                    _cache_put(arxiv_cache, (sanitized_topic, max_results), (fetched_at, topic_papers))
+                    for paper in topic_papers:
+                        if paper.id not in seen_ids:
+                            seen_ids.add(paper.id)
+                            papers.append(paper)
+            else:
+                # Fall back to one request per topic, each with its own
+                # timeout, so a single slow or failing topic can't discard
+                # every other topic's results
+                responses = await asyncio.gather(
+                    *(
+                        asyncio.wait_for(
+                            client.get(
+                                ARXIV_API_URL,
+                                params={
+                                    "search_query": f"cat:{topic}",
+                                    "start": 0,
+                                    "max_results": max_results,
+                                    "sortBy": "submittedDate",
+                                    "sortOrder": "descending",
+                                },
+                            ),
+                            ARXIV_FETCH_TIMEOUT,
                         )
-                        
-                        papers.append(paper)
-                        
-                    except Exception as e:
-                        logger.error(f"Error processing paper entry: {e}")
+                        for topic in uncached_topics
+                    ),
+                    return_exceptions=True,
+                )
+
+                for sanitized_topic, response in zip(uncached_topics, responses):
+                    if isinstance(response, Exception):
+                        logger.error(f"Error fetching topic {sanitized_topic}: {response}")
+                        failed_topics.append(sanitized_topic)
                         continue
-                        
-    except httpx.HTTPError as e:
-        logger.error(f"HTTP error fetching from arXiv: {e}")
-        raise HTTPException(status_code=503, detail="arXiv API is temporarily unavailable")
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-    
-    # Remove duplicates based on paper ID
-    unique_papers = {}
-    for paper in papers:
-        if paper.id not in unique_papers:
-            unique_papers[paper.id] = paper
-    
-    # Convert back to list, sort by publication date (most recent first) and limit results
-    papers = list(unique_papers.values())
-    papers.sort(key=lambda x: x.published, reverse=True)
-    return papers[:max_results]
+                    try:
+                        response.raise_for_status()
+                    except httpx.HTTPStatusError as e:
+                        logger.error(f"arXiv returned an error for topic {sanitized_topic}: {e}")
+                        failed_topics.append(sanitized_topic)
+                        continue
+
+                    topic_papers = [
+                        paper for paper, _ in await asyncio.to_thread(
+                            parse_arxiv_feed, response.content, max_results
+                        )
+                    ]
+                    _cache_put(arxiv_cache, (sanitized_topic, max_results), (fetched_at, topic_papers))
+                    for paper in topic_papers:
+                        if paper.id not in seen_ids:
+                            seen_ids.add(paper.id)
+                            papers.append(paper)
+
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+        # All-or-nothing failure still surfaces as an outage; anything less
+        # returns the topics that did succeed
+        if failed_topics and not papers:
+            raise HTTPException(status_code=503, detail="arXiv API is temporarily unavailable")
+
+    # Sort by publication date (most recent first) and limit results
+    papers.sort(key=lambda x: x._published_dt, reverse=True)
+    return papers[:max_results], failed_topics
+
+# Prebuilt responses for the static endpoints: the payloads never change, so
+# serialize once at import time instead of per request. The short max-age lets
+# clients and proxies absorb polling bursts without going stale.
+_ROOT_BODY = orjson.dumps({"message": "Podcast Studio API is running"})
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
+
+def _static_json_headers(body: bytes) -> dict:
+    return {
+        "Cache-Control": "max-age=1",
+        "ETag": f'"{hashlib.md5(body).hexdigest()}"',
+    }
+
+_ROOT_HEADERS = _static_json_headers(_ROOT_BODY)
+_HEALTH_HEADERS = _static_json_headers(_HEALTH_BODY)
 
 @app.get("/")
 async def root():
-    return {"message": "Podcast Studio API is running"}
+    return Response(content=_ROOT_BODY, media_type="application/json", headers=_ROOT_HEADERS)
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
+    return Response(content=_HEALTH_BODY, media_type="application/json", headers=_HEALTH_HEADERS)
 
-@app.post("/api/papers", response_model=PaperResponse)
-async def fetch_papers(request: PaperRequest, http_request: Request):
+@app.post("/api/papers")
+async def fetch_papers(request: PaperRequest, http_request: Request) -> Response:
     """Fetch papers from arXiv based on selected topics"""
     # Rate limiting
     client_ip = http_request.client.host if http_request.client else "unknown"
-    if not check_rate_limit(client_ip):
+    if not await check_rate_limit(client_ip):
         raise HTTPException(status_code=429, detail="Rate limit exceeded. Please try again later.")
-    
+
+    # Serve repeat topic sets straight from the serialized-body cache
+    cache_key = tuple(sorted(request.topics))
+    cached = papers_response_cache.get(cache_key)
+    if cached and time.time() - cached[0] < ARXIV_CACHE_TTL:
+        return Response(content=cached[1], media_type="application/json")
+
     try:
-        papers = await fetch_arxiv_papers(request.topics)
-        return PaperResponse(papers=papers)
-    
+        papers, failed_topics = await fetch_arxiv_papers(request.topics, http_request.app.state.http)
+        payload = {"papers": [paper.model_dump() for paper in papers]}
+        if failed_topics:
+            # Partial success: return what we have, flag the rest, and skip
+            # caching so the failed topics are retried on the next request
+            payload["warnings"] = [
+                f"Results for '{topic}' are temporarily unavailable" for topic in failed_topics
+            ]
+            return Response(content=orjson.dumps(payload), media_type="application/json")
+
+        body = orjson.dumps(payload)
+        _cache_put(papers_response_cache, cache_key, (time.time(), body))
+        return Response(content=body, media_type="application/json")
+
     except HTTPException:
         raise
     except Exception as e:
@@ -219,4 +574,7 @@ async def fetch_papers(request: PaperRequest, http_request: Request):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
+    # uvicorn[standard] ships uvloop and httptools; select them explicitly so
+    # the faster event loop and HTTP parser are used rather than the stdlib
+    # asyncio defaults
+    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info", loop="uvloop", http="httptools")
@@ -6,6 +6,7 @@ Quick health check for Virtual Podcast Studio
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from urllib.request import urlopen
 from urllib.error import URLError
 
@@ -13,14 +14,17 @@ def check_frontend_env():
     """Check if OpenAI API key is set in frontend .env.local"""
     frontend_env_path = 'podcast-studio/.env.local'
     if os.path.exists(frontend_env_path):
+        # Scan line by line and stop at the key instead of reading the whole
+        # file and re-splitting it
         with open(frontend_env_path, 'r') as f:
-            content = f.read()
-            if 'OPENAI_API_KEY=' in content and len(content.split('OPENAI_API_KEY=')[1].split('\n')[0].strip()) > 10:
-                print("✅ OpenAI API key found in podcast-studio/.env.local")
-                return True
-            else:
-                print("❌ OPENAI_API_KEY not properly set in podcast-studio/.env.local")
-                return False
+            for line in f:
+                if line.startswith('OPENAI_API_KEY='):
+                    if len(line[len('OPENAI_API_KEY='):].strip()) > 10:
+                        print("✅ OpenAI API key found in podcast-studio/.env.local")
+                        return True
+                    break
+        print("❌ OPENAI_API_KEY not properly set in podcast-studio/.env.local")
+        return False
     else:
         print("❌ podcast-studio/.env.local file not found")
         print("💡 Create it with: echo 'OPENAI_API_KEY=sk-...' > podcast-studio/.env.local")
@@ -28,36 +32,34 @@ def check_frontend_env():
 
 def check_backend_health():
     """Check if backend is running (optional, only needed for papers API)"""
+    # Returns (ok, lines) so the probe can run in a worker thread without
+    # interleaving its output with the frontend check
     try:
         response = urlopen('http://localhost:8000/health', timeout=5)
         if response.status == 200:
             data = json.loads(response.read().decode())
-            print("✅ Backend is running (papers API available)")
-            print(f"   Status: {data.get('status')}")
-            return True
+            return True, ["✅ Backend is running (papers API available)",
+                          f"   Status: {data.get('status')}"]
     except URLError:
-        print("⚠️  Backend not running (papers API unavailable)")
-        print("   Note: Backend is only needed for arXiv paper search.")
-        print("   Realtime conversations work without it.")
-        return False
+        return False, ["⚠️  Backend not running (papers API unavailable)",
+                       "   Note: Backend is only needed for arXiv paper search.",
+                       "   Realtime conversations work without it."]
     except Exception as e:
-        print(f"⚠️  Backend check failed: {e}")
-        return False
+        return False, [f"⚠️  Backend check failed: {e}"]
+    return False, ["⚠️  Backend returned an unexpected status"]
 
 def check_frontend_running():
     """Check if Next.js frontend is running"""
     try:
         response = urlopen('http://localhost:3000/', timeout=5)
         if response.status == 200:
-            print("✅ Frontend is running")
-            return True
+            return True, ["✅ Frontend is running"]
     except URLError:
-        print("⚠️  Frontend not running")
-        print("💡 Start with: cd podcast-studio && npm run dev")
-        return False
+        return False, ["⚠️  Frontend not running",
+                       "💡 Start with: cd podcast-studio && npm run dev"]
     except Exception as e:
-        print(f"⚠️  Frontend check failed: {e}")
-        return False
+        return False, [f"⚠️  Frontend check failed: {e}"]
+    return False, ["⚠️  Frontend returned an unexpected status"]
 
 def main():
     print("🏥 Virtual Podcast Studio - Health Check")
@@ -65,12 +67,16 @@ def main():
     
     # Check frontend .env.local (required for realtime)
     frontend_key_ok = check_frontend_env()
-    
-    # Check frontend (required)
-    frontend_ok = check_frontend_running()
-    
-    # Check backend (optional, only for papers)
-    backend_ok = check_backend_health()
+
+    # Probe frontend (required) and backend (optional, only for papers) in
+    # parallel so a down service costs one 5s timeout instead of two
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        frontend_future = pool.submit(check_frontend_running)
+        backend_future = pool.submit(check_backend_health)
+        frontend_ok, frontend_lines = frontend_future.result()
+        backend_ok, backend_lines = backend_future.result()
+    for line in frontend_lines + backend_lines:
+        print(line)
     
     print("=" * 50)
     